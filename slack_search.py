@@ -1,35 +1,127 @@
 import glob
-import gzip
+import heapq
+import html
 import json
 import os
 import re
-import subprocess
 import sys
+import time
 import webbrowser
-from datetime import datetime
-from typing import Iterable, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, Tuple
+
+try:
+    # orjson is considerably faster than the standard library on large chunk lines.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
+try:
+    # python-isal is a drop-in replacement for gzip that decompresses several times faster.
+    from isal.igzip import open as gzip_open
+    from isal.isal_zlib import decompressobj
+except ImportError:
+    from gzip import open as gzip_open  # type: ignore[assignment]
+    from zlib import decompressobj  # type: ignore[assignment]
+
+try:
+    # pyahocorasick finds any of several literal terms in a single pass over the text.
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
+
+try:
+    # google-re2 matches in linear time, so user-supplied patterns can't backtrack catastrophically.
+    import re2  # type: ignore
+except ImportError:
+    re2 = None
+
+# Characters that give a search term regex meaning; terms without any of them are matched
+# with a plain case-insensitive substring test instead of the regex engine.
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Characters that may appear escaped in the raw JSON written by slackdump (Go's encoder escapes
+# <, > and & on top of quotes and backslashes), so a literal containing them can't be looked
+# for in the undecoded line.
+_JSON_ESCAPED_CHARACTERS = frozenset('"\\<>&')
+
+# Syntax that RE2 accepts but reads differently from Python's re: its \w, \b, \d and \s classes
+# are ASCII-only, $ doesn't match before a trailing newline, [: starts a POSIX class and {,n} is
+# literal; \p, \z, \C and \Q only exist in RE2. Patterns containing any of these, or the Turkish
+# dotted and dotless i, use re.
+_RE2_DIFFERENT_SYNTAX = re.compile(r"\\[bBdDsSwWpPzCQ]|\$|\[:|\{,|[İı]")
+
+# re.IGNORECASE treats the Turkish dotted and dotless i as cases of i, while RE2 keeps them apart,
+# so they are mapped to i in the text before an RE2 search
+_TURKISH_I = str.maketrans("İı", "ii")
+
+# HTML for a single search result, filled in by format_matches
+_ARTICLE_TEMPLATE = """
+<article class="message">
+    <header class="message-header" id="{message_id}">
+        <span class="message-sender">
+            <a href="http://localhost:8080/archives/{channel}" hx-get="/team/[team-id]" hx-target="#thread"> {channel_name}</a>
+        </span>
+        <span class="message-sender">
+            <a href="#" hx-get="/team/{user}" hx-target="#thread"> {user_name}</a>
+        </span>
+        <span class="message-timestamp grey">{date_time}</span>
+        <span class="message-link"><a href="{url}">open</a></span>
+    </header>
+    <div class="message-content">
+        <p>{message_text}</p>
+    </div>
+</article>
+"""
+
+# Number of bytes iter_gzip_lines first reads from a file, and inflates, at a time. Callers
+# usually only want the first line, so it starts small and doubles up to GZIP_MAX_READ_SIZE.
+GZIP_INITIAL_READ_SIZE = 4 * 1024
+GZIP_MAX_READ_SIZE = 256 * 1024
+
+# Sort key for the match tuples yielded by search_in_stream
+_message_id = itemgetter(2)
+
+# Name of the file, inside the archive directory, that caches the user and channel lookups
+LOOKUP_CACHE_FILENAME = ".slack_lookup_cache.json"
+
+# Lookups already loaded by get_lookups, keyed on archive directory, with the archive mtime they
+# were loaded for
+_loaded_lookups: dict[str, Tuple[float, Tuple[dict[str, str], dict[str, str]]]] = {}
 
 
 def search_in_stream(
-    file_stream: Iterable[str], search_term: str
+    file_stream: Iterable[str | bytes], search_term: str | list[str]
 ) -> Iterable[Tuple[str, str, str, str, str]]:
     """
         Search for a given term in a stream of JSON data and yield the matching message IDs, message texts, and URLs.
 
     n    Args:
-            file_stream (Iterable[str]): A stream of JSON data.
-            search_term (str): The search term to look for.
+            file_stream (Iterable[str | bytes]): A stream of JSON data.
+            search_term (str | list[str]): The search term to look for, or several terms to look
+                for any of.
 
         Yields:
             Tuple[str, str, str]: The message ID, message text, and URL for each matching message.
     """
+    terms = [search_term] if isinstance(search_term, str) else search_term
+    matches = message_matcher(terms)
+    could_match = raw_line_screen(terms)
     for line in file_stream:
-        data = json.loads(line)
+        # Skip lines that can't contain the terms without paying to parse them
+        if not could_match(line):
+            continue
+        # Lines are parsed one at a time on purpose: chunk lines are kilobytes long, and joining
+        # them into one JSON array to parse in a batch measured slower with orjson
+        data = json_loads(line)
+        if "m" not in data:
+            continue
         channel = data["id"]
         is_thread = data["t"] == 1
         timestamp = data["r"] if is_thread else None
-        if "m" not in data:
-            continue
         for message in data["m"]:
             if "text" not in message:
                 # print('no text in message')
@@ -37,7 +129,7 @@ def search_in_stream(
             message_text = message["text"]
             message_id = message["ts"]
             user = message.get("user")
-            if re.search(search_term, message_text, re.IGNORECASE):
+            if matches(message_text):
                 if is_thread:
                     url = generate_thread_url(channel, timestamp, message_id)
                 else:
@@ -45,85 +137,422 @@ def search_in_stream(
                 yield (channel, user, message_id, message_text, url)
 
 
+def join_search_terms(search_term: str | list[str]) -> str:
+    """
+    Combine several search terms into a single regex that matches any of them.
+
+    Args:
+        search_term (str | list[str]): The search term, or several terms, to look for.
+
+    Returns:
+        str: The combined regex (a single term is returned as is).
+    """
+    if isinstance(search_term, str):
+        return search_term
+    if len(search_term) == 1:
+        return search_term[0]
+    return "|".join(f"(?:{term})" for term in search_term)
+
+
+class _Re2Pattern:
+    """An RE2 pattern whose search matches the Turkish i the way re.IGNORECASE does."""
+
+    def __init__(self, pattern) -> None:
+        self._pattern = pattern
+
+    def search(self, text: str):
+        if "İ" in text or "ı" in text:
+            text = text.translate(_TURKISH_I)
+        return self._pattern.search(text)
+
+
+def compile_search_pattern(search_term: str | list[str]) -> re.Pattern[str]:
+    """
+    Compile a search term into a case-insensitive pattern, using RE2 when it is installed and
+    would find the same matches as re.
+
+    Args:
+        search_term (str | list[str]): The search term, or several terms to match any of.
+
+    Returns:
+        re.Pattern[str]: The compiled pattern (an RE2 pattern with the same interface if available).
+    """
+    search_term = join_search_terms(search_term)
+    if re2 is not None and not _RE2_DIFFERENT_SYNTAX.search(search_term):
+        options = re2.Options()
+        options.case_sensitive = False
+        options.log_errors = False
+        try:
+            return _Re2Pattern(re2.compile(search_term, options))  # type: ignore[return-value]
+        except re2.error:
+            # RE2 has no backreferences or lookaround, so leave those patterns to re
+            pass
+    return re.compile(search_term, re.IGNORECASE)
+
+
+def message_matcher(search_term: str | list[str]) -> Callable[[str], bool]:
+    """
+    Get a check for whether a message's text matches the search terms.
+
+    A single plain-text term is found with a substring test and several with an Aho-Corasick
+    automaton when pyahocorasick is installed; anything else goes through the compiled pattern.
+
+    Args:
+        search_term (str | list[str]): The search term, or several terms to match any of.
+
+    Returns:
+        Callable[[str], bool]: Returns True for message texts that match.
+    """
+    terms = [search_term] if isinstance(search_term, str) else search_term
+    if not any(_REGEX_METACHARACTERS.intersection(term) for term in terms):
+        if len(terms) == 1:
+            literal = terms[0].lower()
+            return lambda text: literal in text.lower()
+        # An empty term matches every message, which the automaton would never report
+        if ahocorasick is not None and all(terms):
+            # Finds any of the terms in one pass over a message, however many terms there are
+            automaton = ahocorasick.Automaton()
+            for term in terms:
+                automaton.add_word(term.lower(), term)
+            automaton.make_automaton()
+            return lambda text: next(automaton.iter(text.lower()), None) is not None
+    pattern = compile_search_pattern(search_term)
+    return lambda text: pattern.search(text) is not None
+
+
+def raw_line_needles(search_term: str | list[str]) -> list[bytes] | None:
+    """
+    Get the bytes to look for in a raw JSON line to tell whether it could match the search terms.
+
+    Args:
+        search_term (str | list[str]): The search term, or several terms, to look for.
+
+    Returns:
+        list[bytes] | None: The lowercased terms, or None if any term is a regex or could be
+            escaped differently in the raw JSON.
+    """
+    terms = [search_term] if isinstance(search_term, str) else search_term
+    for term in terms:
+        if (
+            not term.isascii()
+            or not term.isprintable()
+            or _REGEX_METACHARACTERS.intersection(term)
+            or _JSON_ESCAPED_CHARACTERS.intersection(term)
+        ):
+            return None
+    return [term.lower().encode() for term in terms]
+
+
+def raw_line_screen(search_term: str | list[str]) -> Callable[[str | bytes], bool]:
+    """
+    Get a check for whether a raw JSON line could match the search terms, from raw_line_needles.
+
+    Args:
+        search_term (str | list[str]): The search term, or several terms, to look for.
+
+    Returns:
+        Callable[[str | bytes], bool]: Returns False for lines that can't match, and True for
+            the rest (every line, if the terms have no needles).
+    """
+    needles = raw_line_needles(search_term)
+    if needles is None:
+        return lambda line: True
+
+    def could_match(line: str | bytes) -> bool:
+        raw_line = (line if isinstance(line, bytes) else line.encode()).lower()
+        return any(needle in raw_line for needle in needles)
+
+    return could_match
+
+
 def get_user_lookup(file_path: str) -> dict[str, str]:
     user_lookup = {}
-    with gzip.open(file_path, "rt") as f:
-        for line in f:
-            users = json.loads(line)["u"]
-            for user in users:
-                user_id = user["id"]
-                display_name = user["profile"]["display_name"]
-                user_lookup[user_id] = display_name
+    # The users file is small, so decompress it in one go rather than line by line
+    with gzip_open(file_path, "rb") as f:
+        raw = f.read()
+    for line in raw.splitlines():
+        users = json_loads(line)["u"]
+        for user in users:
+            user_id = user["id"]
+            display_name = user["profile"]["display_name"]
+            user_lookup[user_id] = display_name
     return user_lookup
 
 
 def get_channel_lookup(directory_path: str, user_lookup: dict[str, str]) -> dict[str, str]:
+    with os.scandir(directory_path) as entries:
+        archive_files = [entry for entry in entries if entry.name.endswith(".json.gz")]
+    # Read the files in inode order, which tends to follow their layout on disk
+    archive_files.sort(key=lambda entry: entry.inode())
+    file_paths = [entry.path for entry in archive_files]
+    # Decompression releases the GIL, so threads are enough to read the files concurrently
     channel_lookup = {}
-    for filename in os.listdir(directory_path):
-        if filename.endswith(".json.gz"):
-            file_path = os.path.join(directory_path, filename)
-            with gzip.open(file_path, "rt") as f:
-                for line in f:
-                    data = json.loads(line)
-                    if data["t"] == 5:  # Check for "t: 5" entries
-                        channel_id = data["id"]
-                        channel_info = data["ci"]
-
-                        # Determine the best name to use
-                        if channel_info["is_im"]:
-                            # For direct messages, use "dm_" prefix with the user ID
-                            if channel_info["user"] in user_lookup:
-                                channel_name = f"@{user_lookup[channel_info['user']]}"
-                            else:
-                                channel_name = f"@{channel_info['user']}"
-                        elif channel_info["name"]:
-                            channel_name = channel_info["name"]
-                        elif channel_info["name_normalized"]:
-                            channel_name = channel_info["name_normalized"]
-                        else:
-                            channel_name = (
-                                channel_id  # Fallback to channel ID if no name is available
-                            )
-
-                        channel_lookup[channel_id] = channel_name
-                        break  # Stop after finding the first "t: 5" entry
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for channel in executor.map(get_channel_name, file_paths, repeat(user_lookup)):
+            if channel is not None:
+                channel_id, channel_name = channel
+                channel_lookup[channel_id] = channel_name
     return channel_lookup
 
 
-def search_json(file_stream: Iterable[str], dir: str, search_term: str) -> str:
+def get_channel_name(file_path: str, user_lookup: dict[str, str]) -> Tuple[str, str] | None:
+    # The channel record is normally the first line, so read lines straight off a decompressor
+    # instead of setting up a full gzip file object
+    for line in iter_gzip_lines(file_path):
+        data = json_loads(line)
+        if data["t"] == 5:  # Check for "t: 5" entries
+            channel_id = data["id"]
+            channel_info = data["ci"]
+
+            # Determine the best name to use
+            if channel_info["is_im"]:
+                # For direct messages, use "dm_" prefix with the user ID
+                if channel_info["user"] in user_lookup:
+                    channel_name = f"@{user_lookup[channel_info['user']]}"
+                else:
+                    channel_name = f"@{channel_info['user']}"
+            elif channel_info["name"]:
+                channel_name = channel_info["name"]
+            elif channel_info["name_normalized"]:
+                channel_name = channel_info["name_normalized"]
+            else:
+                channel_name = channel_id  # Fallback to channel ID if no name is available
+
+            # Stop after finding the first "t: 5" entry, without decompressing the rest
+            return channel_id, channel_name
+    return None
+
+
+def iter_gzip_lines(file_path: str) -> Iterator[bytes]:
+    """
+    Yield the lines of a gzip file, only decompressing as much of it as has been read.
+
+    Args:
+        file_path (str): Path to a gzip file.
+
+    Yields:
+        bytes: Each line of the decompressed file, without its trailing newline.
+    """
+    with open(file_path, "rb") as f:
+        decompressor = decompressobj(wbits=31)  # 31 selects the gzip container format
+        pending: list[bytes] = []
+        read_size = GZIP_INITIAL_READ_SIZE
+        data = f.read(read_size)
+        while True:
+            chunk = decompressor.decompress(data, read_size)
+            if b"\n" in chunk:
+                *lines, rest = b"".join(pending + [chunk]).split(b"\n")
+                yield from lines
+                pending = [rest]
+            else:
+                pending.append(chunk)
+
+            # eof comes first: at the end of a member the bytes after it can be left in both
+            # unconsumed_tail and unused_data
+            if decompressor.eof:
+                # Carry on into the next member of a multi-member gzip file, skipping the null
+                # padding gzip allows between and after members
+                data = decompressor.unused_data.lstrip(b"\0")
+                while not data and (data := f.read(read_size)):
+                    data = data.lstrip(b"\0")
+                if not data:
+                    break
+                decompressor = decompressobj(wbits=31)
+            elif decompressor.unconsumed_tail:
+                data = decompressor.unconsumed_tail
+            else:
+                data = f.read(read_size)
+                # Output held back by the read limit still comes out with no new input, so
+                # only stop once that is drained too (a truncated file just ends early)
+                if not data and not chunk:
+                    break
+            read_size = min(read_size * 2, GZIP_MAX_READ_SIZE)
+        rest = b"".join(pending)
+        if rest:
+            yield rest
+
+
+def get_lookups(directory_path: str) -> Tuple[dict[str, str], dict[str, str]]:
+    """
+    Get the user and channel lookups for an archive, reusing a cached copy when possible.
+
+    The lookups are kept in memory for the life of the process and saved as JSON to
+    LOOKUP_CACHE_FILENAME in the archive directory. Both copies are rebuilt whenever the
+    directory or any .json.gz file in it has changed, or the saved cache can't be read.
+
+    Args:
+        directory_path (str): The slackdump archive directory.
+
+    Returns:
+        Tuple[dict[str, str], dict[str, str]]: The user lookup and the channel lookup.
+    """
+    archive_mtime = get_archive_mtime(directory_path)
+    loaded = _loaded_lookups.get(directory_path)
+    if loaded is not None and loaded[0] == archive_mtime:
+        return loaded[1]
+
+    _loaded_lookups[directory_path] = load_lookups(directory_path, archive_mtime)
+    return _loaded_lookups[directory_path][1]
+
+
+def get_archive_mtime(directory_path: str) -> float:
+    """
+    Get the newest mtime of an archive directory and the .json.gz files in it.
+
+    The directory's own mtime changes when files are added, removed or renamed, which catches
+    files copied in with their older mtimes kept (cp -p, tar -x, rsync -a).
+
+    Args:
+        directory_path (str): The slackdump archive directory.
+
+    Returns:
+        float: The newest mtime.
+    """
+    return max(
+        [os.path.getmtime(directory_path)]
+        + [os.path.getmtime(path) for path in glob.glob(os.path.join(directory_path, "*.json.gz"))]
+    )
+
+
+def load_lookups(
+    directory_path: str, archive_mtime: float
+) -> Tuple[float, Tuple[dict[str, str], dict[str, str]]]:
+    """
+    Read the lookups from the archive's cache file if it is up to date, or build and save them.
+
+    Args:
+        directory_path (str): The slackdump archive directory.
+        archive_mtime (float): The current archive mtime, from get_archive_mtime.
+
+    Returns:
+        Tuple[float, Tuple[dict[str, str], dict[str, str]]]: The archive mtime the lookups are up
+            to date for, and the user lookup and the channel lookup.
+    """
+    cache_path = os.path.join(directory_path, LOOKUP_CACHE_FILENAME)
+    try:
+        with open(cache_path, "rb") as f:
+            cache = json_loads(f.read())
+        # Compared for equality rather than against the cache file's own mtime, which can share a
+        # timestamp tick with a change made just after the cache was written
+        if cache["archive_mtime"] == archive_mtime:
+            return archive_mtime, (cache["users"], cache["channels"])
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing or corrupt; rebuild it below
+        pass
+
+    user_lookup = get_user_lookup(os.path.join(directory_path, "users.json.gz"))
+    channel_lookup = get_channel_lookup(directory_path, user_lookup)
+    try:
+        created = not os.path.exists(cache_path)
+        with open(cache_path, "w") as f:
+            if created:
+                # Creating the cache file has just changed the directory mtime
+                archive_mtime = max(archive_mtime, os.path.getmtime(directory_path))
+            json.dump(
+                {"archive_mtime": archive_mtime, "users": user_lookup, "channels": channel_lookup},
+                f,
+            )
+    except OSError:
+        # The archive may be read-only; the lookups just won't be cached
+        pass
+    return archive_mtime, (user_lookup, channel_lookup)
+
+
+def search_json(
+    file_stream: Iterable[str | bytes],
+    dir: str,
+    search_term: str | list[str],
+    limit: int | None = None,
+) -> str:
     """
     Search for a given term in a stream of JSON data and return an HTML string with the matching messages and their URLs.
     Args:
-        file_stream (Iterable[str]): A stream of JSON data.
-        search_term (str): The search term to look for.
+        file_stream (Iterable[str | bytes]): A stream of JSON data.
+        search_term (str | list[str]): The search term to look for, or several terms to look for any of.
+        limit (int | None): The maximum number of (newest) matches to include, or None for all.
+    Returns:
+        str: An HTML string with the search results.
+    """
+    return format_matches(search_in_stream(file_stream, search_term), dir, limit)
+
+
+def format_matches(
+    matches: Iterable[Tuple[str, str, str, str, str]], dir: str, limit: int | None = None
+) -> str:
+    """
+    Render matches from search_in_stream as an HTML string, newest first.
+    Args:
+        matches (Iterable[Tuple[str, str, str, str, str]]): The matches yielded by search_in_stream.
+        dir (str): The slackdump archive directory, used to look up user and channel names.
+        limit (int | None): The maximum number of (newest) matches to include, or None for all.
     Returns:
         str: An HTML string with the search results.
     """
-    matches = list(search_in_stream(file_stream, search_term))
-    html_output = f"<h2>Found {len(matches)} matches:</h2>"
-    user_lookup = get_user_lookup(f"{dir}/users.json.gz")
-    channel_lookup = get_channel_lookup(dir, user_lookup)
-    sorted_matches = sorted(matches, key=lambda x: x[2], reverse=True)
+    total = 0
+
+    def counted() -> Iterator[Tuple[str, str, str, str, str]]:
+        nonlocal total
+        for match in matches:
+            total += 1
+            yield match
+
+    # With a limit, keep only the newest matches in a bounded heap instead of sorting them all
+    if limit is None:
+        sorted_matches = sorted(counted(), key=_message_id, reverse=True)
+    else:
+        sorted_matches = heapq.nlargest(limit, counted(), key=_message_id)
+
+    if len(sorted_matches) < total:
+        parts = [f"<h2>Found {total} matches, showing the newest {len(sorted_matches)}:</h2>"]
+    else:
+        parts = [f"<h2>Found {total} matches:</h2>"]
+    user_lookup, channel_lookup = get_lookups(os.path.abspath(dir))
+
+    # Bind the lookups and methods used per row to locals ahead of the loop
+    channel_get = channel_lookup.get
+    user_get = user_lookup.get
+    append = parts.append
+    render = _ARTICLE_TEMPLATE.format
+    escape = html.escape
+    unescape = html.unescape
+    format_time = format_timestamp
     for channel, user, message_id, message_text, url in sorted_matches:
-        date_time = datetime.fromtimestamp(float(message_id)).strftime("%Y-%m-%d %H:%M:%S")
-        html_output += f"""
-<article class="message">
-    <header class="message-header" id="{message_id}">
-        <span class="message-sender">
-            <a href="http://localhost:8080/archives/{channel}" hx-get="/team/[team-id]" hx-target="#thread"> {channel_lookup[channel]}</a>
-        </span>
-        <span class="message-sender">
-            <a href="#" hx-get="/team/{user}" hx-target="#thread"> {user_lookup.get(user, user)}</a>
-        </span>
-        <span class="message-timestamp grey">{date_time}</span>
-        <span class="message-link"><a href="{url}">open</a></span>
-    </header>
-    <div class="message-content">
-        <p>{message_text}</p>
-    </div>
-</article>
-"""
-    return html_output
+        date_time = format_time(int(float(message_id)))
+        channel_name = escape(channel_get(channel, channel))
+        user_name = user_get(user, user)
+        if user is not None:
+            user = escape(user)
+            user_name = escape(user_name)
+        # Slack already stores &, < and > in message text as entities, so decode them first
+        # rather than escaping them twice
+        message_text = escape(unescape(message_text))
+        append(
+            render(
+                channel=channel,
+                channel_name=channel_name,
+                user=user,
+                user_name=user_name,
+                message_id=message_id,
+                date_time=date_time,
+                url=url,
+                message_text=message_text,
+            )
+        )
+    return "".join(parts)
+
+
+@lru_cache(maxsize=8192)
+def format_timestamp(seconds: int) -> str:
+    """
+    Format a Unix timestamp as local time. Cached, since busy channels post many messages a second.
+
+    Args:
+        seconds (int): The timestamp, in whole seconds.
+
+    Returns:
+        str: The formatted date and time.
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
 
 
 def generate_message_url(channel: str, message_id: str) -> str:
@@ -286,37 +715,68 @@ def write_html(body: str) -> None:
     # print("The temporary HTML file has been deleted.")
 
 
-def search_folder(folder_path: str, search_term: str) -> str | None:
+def search_folder(
+    folder_path: str, search_term: str | list[str], limit: int | None = None
+) -> str | None:
     # Use glob to expand the pattern
     files = glob.glob(os.path.join(folder_path, "*.json.gz"))
     if not files:
         print(f"Error: No .json.gz files found in {folder_path}", file=sys.stderr)
         return None
 
-    # Use zgrep on the expanded list of files
-    cmd = ["zgrep", "-ih", search_term] + files
-    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    stdout, stderr = process.communicate()
+    # Compile the pattern once up front, so a bad pattern is reported here rather than raised
+    # from every worker process
+    try:
+        compile_search_pattern(search_term)
+    except re.error as e:
+        print(f"Error: invalid search pattern: {e}", file=sys.stderr)
+        return None
 
-    if stderr:
-        print(f"Error: {stderr}", file=sys.stderr)
+    # Search the files in parallel, one worker process per CPU
+    matches: list[Tuple[str, str, str, str, str]] = []
+    try:
+        with ProcessPoolExecutor() as executor:
+            for file_matches in executor.map(search_file, files, repeat(search_term)):
+                matches.extend(file_matches)
+    except (OSError, EOFError, re.error) as e:
+        print(f"Error: {e}", file=sys.stderr)
         return None
 
-    return search_json(stdout.splitlines(), folder_path, search_term)
+    return format_matches(matches, folder_path, limit)
+
+
+def search_file(
+    file_path: str, search_term: str | list[str]
+) -> list[Tuple[str, str, str, str, str]]:
+    """
+    Search a single gzipped chunk file with search_in_stream.
+
+    Args:
+        file_path (str): Path to a .json.gz file from the archive.
+        search_term (str | list[str]): The search term to look for, or several terms to look for any of.
+
+    Returns:
+        list[Tuple[str, str, str, str, str]]: The matches found in the file.
+    """
+    # search_in_stream screens raw lines itself when the terms allow it; other terms (regexes,
+    # non-ASCII text, characters JSON escapes) can only be matched once a line is parsed
+    with gzip_open(file_path, "rb") as f:
+        return list(search_in_stream(f, search_term))
 
 
 if __name__ == "__main__":
-    if len(sys.argv) == 4:
+    if len(sys.argv) >= 4:
         input_path = sys.argv[1]
         slackdump_folder = sys.argv[2]
-        search_term = sys.argv[3]
+        # Several search terms find messages matching any of them
+        search_term = sys.argv[3] if len(sys.argv) == 4 else sys.argv[3:]
 
         if os.path.isdir(input_path):
             output = search_folder(input_path, search_term)
         elif input_path == "-":
-            output = search_json(sys.stdin, slackdump_folder, search_term)
+            output = search_json(sys.stdin.buffer, slackdump_folder, search_term)
         elif os.path.isfile(input_path):
-            with open(input_path, "r") as file:
+            with open(input_path, "rb") as file:
                 output = search_json(file, slackdump_folder, search_term)
         else:
             print(f"Error: {input_path} is not a valid file or directory", file=sys.stderr)
@@ -326,8 +786,11 @@ if __name__ == "__main__":
             write_html(output)
     else:
         print(
-            "Usage: python slack_search.py <JSON file_path or directory> <directory> <search term>"
+            "Usage: python slack_search.py <JSON file_path or directory> <directory> <search term> [<search term> ...]"
         )
         print(
             'or use stdin: zgrep -ih "$SEARCH_TERM" slackdump_20240807_214838/*.json.gz | python3 slack_search.py - slackdump_20240807_214838 "$SEARCH_TERM"'
         )
+        print(
+            'with several terms, give zgrep each of them too: zgrep -ih -e "$TERM_1" -e "$TERM_2" slackdump_20240807_214838/*.json.gz | python3 slack_search.py - slackdump_20240807_214838 "$TERM_1" "$TERM_2"'
+        )
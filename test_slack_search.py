@@ -0,0 +1,39 @@
+import gzip
+import os
+import random
+import tempfile
+import unittest
+
+from slack_search import iter_gzip_lines
+
+
+class IterGzipLinesTest(unittest.TestCase):
+    def setUp(self):
+        # Compressible enough that a member's output outlasts the first read, which used to leave
+        # the next member's bytes stuck in unconsumed_tail once the member ended
+        rng = random.Random(0)
+        self.text = "".join(rng.choice("ab \n") for _ in range(30_000)).encode()
+        self.members = [gzip.compress(self.text[i : i + 10_000]) for i in range(0, 30_000, 10_000)]
+
+    def read_lines(self, data: bytes) -> list[bytes]:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.json.gz")
+            with open(path, "wb") as f:
+                f.write(data)
+            return list(iter_gzip_lines(path))
+
+    def test_single_member(self):
+        data = gzip.compress(self.text)
+        self.assertEqual(self.read_lines(data), gzip.decompress(data).splitlines())
+
+    def test_multiple_members(self):
+        data = b"".join(self.members)
+        self.assertEqual(self.read_lines(data), gzip.decompress(data).splitlines())
+
+    def test_null_padding(self):
+        data = b"".join(member + b"\0" * 100 for member in self.members) + b"\0" * 10_000
+        self.assertEqual(self.read_lines(data), gzip.decompress(data).splitlines())
+
+
+if __name__ == "__main__":
+    unittest.main()